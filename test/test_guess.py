@@ -1,6 +1,6 @@
 import pytest
 
-from wordly.guess import guess_result
+from wordly.guess import guess_result, guess_result_code, INEXACT_MATCH, NON_MATCH
 
 
 @pytest.mark.parametrize("word, response", [
@@ -15,3 +15,16 @@ def test_guess_response(word, response):
     target = 'FOOLS'
     assert guess_result(word, target) == response
 
+
+@pytest.mark.parametrize("word", [
+    'FOOLS', 'COOLS', 'OOOOO', 'OXXOO', 'OBOES', 'XXOOX', 'GRASS',
+])
+def test_guess_result_code(word):
+    # the code is the base-3 encoding of the guess_result string
+    target = 'FOOLS'
+    expected = 0
+    for rc in guess_result(word, target):
+        trit = 1 if rc == INEXACT_MATCH else (0 if rc == NON_MATCH else 2)
+        expected = expected * 3 + trit
+    assert guess_result_code(word, target) == expected
+
@@ -1,7 +1,23 @@
-from wordly.guess import Guess
-from wordly.solver import Solver
+from wordly.guess import Guess, guess_result_code
+from wordly.solver import Solver, _build_feedback_matrix, recommend_next_words
 
 
 def test_solver():
     s = Solver()
     s.get_next_words([Guess('KNIFE', '.....')])
+
+
+def test_feedback_matrix():
+    guesses = ['GRASS', 'CHESS', 'OOOOO', 'CRANE', 'SOLID']
+    targets = ['SWIMS', 'ASSAY', 'FOOLS', 'CAIRN']
+    matrix = _build_feedback_matrix(guesses, targets)
+    for gi, g in enumerate(guesses):
+        for ti, t in enumerate(targets):
+            assert matrix[gi][ti] == guess_result_code(g, t)
+
+
+def test_recommend_next_words_cached():
+    guesses = [Guess('KNIFE', '.....')]
+    first = recommend_next_words(guesses)
+    # a repeat query is served from the cache, so it must match exactly
+    assert recommend_next_words(guesses) == first
@@ -37,3 +37,14 @@ def test_guess_pool(guesses, pool):
         targets.apply_guess(g)
     assert targets.pool == pool
 
+
+
+def test_snapshot_restore():
+    pool = WordPool()
+    snap = pool.snapshot()
+    pool.apply_guess(Guess('WONKS', 'WO.KS'))
+    assert pool.pool == {'WORKS', 'WOCKS'}
+    pool.restore(snap)
+    assert pool.pool == snap
+    # the indexes should be restored along with the pool
+    assert pool.match_char_pos('W', 0) == {w for w in snap if w[0] == 'W'}
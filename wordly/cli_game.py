@@ -2,7 +2,7 @@ import cmd
 
 from wordly.color import ColoredText
 from wordly.game import Game
-from wordly.solver import Solver
+from wordly.solver import recommend_next_words
 
 
 def keyboard_str(guesses: list) -> str:
@@ -56,8 +56,8 @@ class CommandLineGame(cmd.Cmd):
             return True
 
         if w == "?":  # get a hint from the AI
-            s = Solver(hard_mode=self.game.hard_mode, all_words=False)
-            ai_words = s.get_next_words(self.game.guesses)
+            ai_words = recommend_next_words(self.game.guesses,
+                                            hard_mode=self.game.hard_mode, all_words=False)
             ai_word = ai_words[0][0]
             self.game.render_cli()
             print(ColoredText.BLUE + ' '*7 + 'Try the word "{}".\n'.format(ai_word) + ColoredText.NONE)
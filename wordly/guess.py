@@ -12,6 +12,40 @@ class Guess:
     result: str
 
 
+def guess_result_code(word: str, target: str) -> int:
+    """
+    Like guess_result, but return the feedback as a single base-3 integer.
+
+    Each position contributes one trit: 2 for an exact match, 1 for an inexact
+    match, 0 for a nonmatch, giving a code in [0, 242]. Two (word, target)
+    pairs produce the same code exactly when guess_result would return
+    equivalent feedback, so codes can be compared and bucketed without
+    building result strings.
+    """
+    counts = Counter(target)  # tracks matchable letters, removed as they are matched.
+    trits = [0] * 5
+
+    # handle exact matches first
+    for i in range(len(word)):
+        c = word[i]
+        if target[i] == c:
+            trits[i] = 2
+            counts[c] -= 1
+
+    # now do inexact matches
+    for i in range(len(word)):
+        if trits[i] == 0:
+            c = word[i]
+            if c in counts and counts[c] > 0:
+                trits[i] = 1
+                counts[c] -= 1
+
+    code = 0
+    for t in trits:
+        code = code * 3 + t
+    return code
+
+
 def guess_result(word: str, target: str) -> str:
     """
     Compare word and target to determine correct / partially correct letters.
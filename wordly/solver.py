@@ -1,11 +1,171 @@
 import copy
+import os
 import random
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import *
 
-from wordly.guess import Guess, guess_result
+from wordly.guess import Guess
 from wordly.word_pool import WordPool
-from wordly.word_list import all_wordle_words, top_first_guesses, common_wordle_words_4k
+from wordly.word_list import all_wordle_words, top_first_guesses, common_wordle_words_4k_set
+
+
+# Built once at import: word frequencies never change, and recommending words
+# constructs a fresh Solver often enough that rebuilding the dict per instance adds up.
+_FREQS = dict(all_wordle_words)
+
+# Frozen copy of the pre-baked openers, so shuffling recommendations can't
+# mutate the imported list that other modules share.
+_TOP_FIRST_GUESSES = tuple(top_first_guesses)
+
+# Only spread the search across processes for (guess, target) spaces well above
+# the default max_pool_size; below this, worker startup costs more than it saves.
+_PARALLEL_MIN_PAIRS = 250_000
+
+
+def _encode_word(word: str) -> Tuple[Tuple[int, ...], List[int], int]:
+    """
+    Encode a word as (letter codes, letter counts, letter bitmask) for fast
+    feedback computation.
+
+    Letter codes are 0..25 per position; counts is a 26-entry table of how many
+    times each letter appears; the bitmask has bit c set if letter c appears at
+    all. Encoding each word once lets the feedback matrix work entirely on
+    small ints instead of re-hashing characters per pair.
+    """
+    codes = tuple(ord(c) - 65 for c in word)
+    counts = [0] * 26
+    mask = 0
+    for c in codes:
+        counts[c] += 1
+        mask |= 1 << c
+    return codes, counts, mask
+
+
+def _feedback_row(g_codes: Tuple[int, ...], g_has_dups: bool, encoded_targets: list) -> List[int]:
+    """
+    Compute feedback codes for one guess against a whole batch of encoded targets.
+
+    All guess-side work (encoding, duplicate detection) is hoisted out by the
+    caller, so each target costs only the per-position comparisons.
+    """
+    row = []
+    if not g_has_dups:
+        # Fast path: the guess has five distinct letters, so no other guess
+        # position can consume a target letter we need. Green means the
+        # position matches; yellow just means the letter is present anywhere.
+        for t_codes, t_counts, t_mask in encoded_targets:
+            code = 0
+            for i in range(5):
+                gc = g_codes[i]
+                if gc == t_codes[i]:
+                    code = code * 3 + 2
+                elif (t_mask >> gc) & 1:
+                    code = code * 3 + 1
+                else:
+                    code = code * 3
+            row.append(code)
+    else:
+        # General path with full multiset semantics for repeated letters.
+        for t_codes, t_counts, t_mask in encoded_targets:
+            avail = t_counts.copy()  # matchable letters, removed as they are matched
+            trits = [0] * 5
+
+            # handle exact matches first
+            for i in range(5):
+                gc = g_codes[i]
+                if gc == t_codes[i]:
+                    trits[i] = 2
+                    avail[gc] -= 1
+
+            # now do inexact matches, folding the trits into a base-3 code
+            code = 0
+            for i in range(5):
+                t = trits[i]
+                if t == 0:
+                    gc = g_codes[i]
+                    if avail[gc] > 0:
+                        t = 1
+                        avail[gc] -= 1
+                code = code * 3 + t
+            row.append(code)
+    return row
+
+
+def _build_feedback_matrix(guess_pool: List[str], targets_pool: List[str]) -> List[List[int]]:
+    """
+    Precompute the guess feedback for every (guess, target) pair.
+
+    Returns a matrix where entry [gi][ti] is the base-3 feedback code (matching
+    guess_result_code) for guessing guess_pool[gi] against targets_pool[ti].
+    Building this once per search lets the scoring loop work on small ints
+    instead of recomputing feedback strings for every pair.
+    """
+    encoded_targets = [_encode_word(t) for t in targets_pool]
+    matrix = []
+    for g in guess_pool:
+        g_codes, g_counts, _ = _encode_word(g)
+        matrix.append(_feedback_row(g_codes, max(g_counts) > 1, encoded_targets))
+    return matrix
+
+
+def _score_guesses(guess_pool: List[str], feedback: List[List[int]],
+                   cost_exp: float) -> List[Tuple[str, float]]:
+    """
+    Score every guess against a precomputed feedback matrix.
+
+    Returns a (guess, score) pair for every guess, unsorted. Guesses that
+    bail out early carry a partial score, but the bail-out only fires once
+    the partial sum already exceeds the best full score, so sorting by score
+    still ranks the true best guess first. This is the hot kernel of the
+    search, so it's written as a standalone function over plain lists and
+    ints: everything it touches is a local, and n**cost_exp is memoized
+    since bucket sizes repeat constantly across guesses.
+    """
+    guess_scores = []
+    best_score = float('inf')
+    pow_cache = {}
+    for gi, guess in enumerate(guess_pool):
+        # count how many targets land in each of the 3^5 feedback buckets
+        counts = [0] * 243
+        for code in feedback[gi]:
+            counts[code] += 1
+
+        # Each of the n targets in a bucket of size n leaves n survivors, so a bucket
+        # contributes n * n**cost_exp to the score -- same sum as iterating targets,
+        # but over at most 243 buckets instead of the whole target pool. Summing the
+        # largest buckets first makes the partial sum grow fastest, so the bail-out
+        # against best_score fires as early as possible.
+        sizes = [n for n in counts if n]
+        sizes.sort(reverse=True)
+        guess_score = 0
+        for n in sizes:
+            cost = pow_cache.get(n)
+            if cost is None:
+                cost = pow_cache[n] = n * n**cost_exp
+            guess_score += cost
+            if guess_score > best_score:
+                # we already know this guess is worse than one we have
+                # bail outta this trial
+                break
+        if guess_score < best_score:
+            best_score = guess_score
+        guess_scores.append((guess, round(guess_score, 3)))
+    return guess_scores
+
+
+def _score_chunk(args: Tuple[List[str], List[str], float]) -> List[Tuple[str, float]]:
+    """
+    Worker for the parallel search: score one chunk of the guess pool.
+
+    Takes a single args tuple so it can be dispatched with executor.map.
+    Each worker builds the feedback rows for its own chunk, so only the
+    word lists cross the process boundary.
+    """
+    guess_chunk, targets_pool, cost_exp = args
+    feedback = _build_feedback_matrix(guess_chunk, targets_pool)
+    return _score_guesses(guess_chunk, feedback, cost_exp)
 
 
 class Solver:
@@ -14,14 +174,12 @@ class Solver:
         # targets represents the remaining possible solutions to a puzzle after applying guesses
         self.targets = WordPool()
         if not all_words:
-            self.targets.remove_all_except(common_wordle_words_4k)
+            self.targets.remove_all_except(common_wordle_words_4k_set)
 
         # "valids" contains the words that can be guessed. In Easy Mode, "valids" is the
         # whole Wordle dictionary; in Hard Mode it is a subset of that.
         self.valids = WordPool()
-        self.freqs = {}
-        for word, freq in all_wordle_words:
-            self.freqs[word] = freq
+        self.freqs = _FREQS
 
         # params that control the heuristics
         # these have been tuned to produce the best results
@@ -38,38 +196,26 @@ class Solver:
         that's the same every game.
         """
         if len(guesses) == 0:
-            random.shuffle(top_first_guesses)
-            return [(x, 1) for x in top_first_guesses]
-
-        # apply guess feedback to eliminate invalid targets and guesses.
-        for g in guesses:
-            self.targets.apply_guess(g)
-            if self.hard_mode:
-                self.targets.apply_hardmode_constraints(g)
-                self.valids.apply_hardmode_constraints(g)
-        """
-        Return a list of good words to guess next, sorted so the best one is first.
-
-        First guesses are pre-baked; otherwise that's a really long search
-        that's the same every game.
-        """
-        if len(guesses) == 0:
-            random.shuffle(top_first_guesses)
-            return [(x, 1) for x in top_first_guesses]
+            shuffled = random.sample(_TOP_FIRST_GUESSES, len(_TOP_FIRST_GUESSES))
+            return [(x, 1) for x in shuffled]
 
         # apply guess feedback to eliminate invalid targets and guesses.
+        # From here on, self.targets reflects every guess made so far -- the
+        # search below only ever needs to consider the effect of one new guess.
         for g in guesses:
             self.targets.apply_guess(g)
             if self.hard_mode:
                 self.targets.apply_hardmode_constraints(g)
                 self.valids.apply_hardmode_constraints(g)
 
-        # Handle edge case: if there are only two targets left, you don't want to pick
-        # "any guess that reduces the target pool to 1", you want to pick
-        # one of the two possible solutions, thereby profiting from the 50/50 chance
-        # of guessing correctly.
+        # Handle edge case: with one target left the answer is known, and with two
+        # you don't want to pick "any guess that reduces the target pool to 1",
+        # you want to pick one of the two possible solutions, thereby profiting
+        # from the 50/50 chance of guessing correctly. Either way there's no
+        # search to run -- return the remaining targets in random order.
         if len(self.targets.pool) <= 2:
-            return [(random.choice(list(self.targets.pool)), 1)]
+            remaining = self.targets.as_tuple()
+            return [(w, 1) for w in random.sample(remaining, len(remaining))]
 
         # For non-first guesses, we'll do a search.
         # Ideally, we will try each combination of (valid word, target) and
@@ -95,12 +241,12 @@ class Solver:
                 if len(valids_subset.pool) * len(targets_subset.pool) <= self.max_pool_size:
                     # good enough
                     break
-                before = copy.deepcopy(valids_subset)
+                snap = valids_subset.snapshot()
                 valids_subset.apply_nonmatches(guess, result)
                 if len(valids_subset.pool) < 50:
                     # Over-constraining the guess pool leads to dumb guesses
                     # don't go too hard on this
-                    valids_subset = before
+                    valids_subset.restore(snap)
 
 
         # Subsample the guess and target pools as needed to shrink from there.
@@ -109,45 +255,80 @@ class Solver:
                 # reduce the guesses pool
                 size = max(len(valids_subset.pool) // 2, 10)
                 size = min(size, len(valids_subset.pool))
-                vpool = random.sample(list(valids_subset.pool), size)
+                vpool = valids_subset.sample(size)
                 valids_subset.remove_all_except(vpool)
             else:
                 # reduce the targets pool
                 size = max(len(targets_subset.pool) // 2, 10)
                 size = min(size, len(targets_subset.pool))
-                tpool = random.sample(list(targets_subset.pool), size)
+                tpool = targets_subset.sample(size)
                 targets_subset.remove_all_except(tpool)
             pool_size = len(targets_subset.pool) * len(valids_subset.pool)
 
         # now search all (valid guess, target) pairs to find the best guess from the
         # reduced pools.
-        guess_scores = []
-        best_score = float('inf')
         guess_pool = list(valids_subset.pool)
         targets_pool = list(targets_subset.pool)
 
-        for guess in guess_pool:
-            guess_score = 0
-
-            # now, let's see what the solution space looks like after applying this guess
-            new_guesses = copy.deepcopy(guesses)
-            for i, tw in enumerate(targets_pool):
-                targets_copy = copy.deepcopy(targets_subset)
-                result = guess_result(guess, tw)
-                new_guesses.append(Guess(guess, result))
-                for g in new_guesses:
-                    targets_copy.apply_guess(g)
-                    n_left = len(targets_copy.pool)
-                    guess_score += n_left**self.cost_exp
-                if guess_score > best_score:
-                    # we already know this guess is worse than one we have
-                    # bail outta this trial
-                    break
-            if guess_score < best_score:
-                best_score = guess_score
-                guess_scores.append((guess, round(guess_score, 3)))
+        # Evaluate guesses that are still possible answers first: they tend to
+        # score well, which tightens the best score early and lets the scoring
+        # kernel bail out of weaker guesses sooner.
+        guess_pool.sort(key=lambda w: w not in targets_subset.pool)
+
+        # Precompute the feedback code for every (guess, target) pair up front.
+        # Targets that produce the same feedback for a guess are indistinguishable
+        # after that guess, so the pool surviving (guess, target) is exactly the
+        # set of targets sharing target's feedback code.
+        #
+        # Scoring is independent per guess, so when a Solver is configured with a
+        # pool large enough to matter we split the guess pool across processes.
+        # At the default max_pool_size the serial kernel is faster than paying
+        # for worker startup, so this only engages for big custom pools.
+        if len(guess_pool) * len(targets_pool) >= _PARALLEL_MIN_PAIRS and len(guess_pool) > 1:
+            n_workers = os.cpu_count() or 1
+            chunk_size = -(-len(guess_pool) // n_workers)  # ceil division
+            chunks = [guess_pool[i:i + chunk_size] for i in range(0, len(guess_pool), chunk_size)]
+            guess_scores = []
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                for part in executor.map(_score_chunk, [(c, targets_pool, self.cost_exp) for c in chunks]):
+                    guess_scores.extend(part)
+        else:
+            feedback = _build_feedback_matrix(guess_pool, targets_pool)
+            guess_scores = _score_guesses(guess_pool, feedback, self.cost_exp)
 
         print('guess pool size:', len(guess_pool), 'target pool size:', len(targets_pool))
         print('valids:', len(self.valids.pool), 'ntargets:', len(self.targets.pool))
         guess_scores.sort(key=lambda x: x[1])
         return guess_scores
+
+
+@lru_cache(maxsize=1024)
+def _cached_next_words(guess_items: frozenset, hard_mode: bool, all_words: bool) -> tuple:
+    """
+    Run a fresh Solver for a frozen guess history; cached on the history.
+
+    The search subsamples randomly, so the RNG is seeded from the key (and the
+    caller's RNG state restored afterwards) to keep each cached entry
+    deterministic for its inputs.
+    """
+    state = random.getstate()
+    random.seed(hash((guess_items, hard_mode)))
+    try:
+        s = Solver(hard_mode=hard_mode, all_words=all_words)
+        guesses = [Guess(word, result) for word, result in sorted(guess_items)]
+        return tuple(s.get_next_words(guesses))
+    finally:
+        random.setstate(state)
+
+
+def recommend_next_words(guesses: List[Guess], hard_mode: bool = False,
+                         all_words: bool = True) -> List[Tuple[str, float]]:
+    """
+    Return good words to guess next, best first, caching repeated queries.
+
+    Convenience entry point for interactive callers: the same guess history
+    (in any order) maps to the same cache entry, so re-asking for a hint is
+    answered without re-running the search.
+    """
+    key = frozenset((g.word, g.result) for g in guesses)
+    return list(_cached_next_words(key, hard_mode, all_words))
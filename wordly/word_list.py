@@ -12,3 +12,9 @@ top_first_guesses = ['SALET', 'SNORT', 'LIART', 'CORSE', 'EARNT', 'LEAST', 'CART
 not_these = {'JERRY', 'LAURA', 'BILLY', 'NANCY', 'JIMMY', 'BARRY', 'RALPH', 'PERRY', 'EBOOK', 'COLIN', 'DONNA', 'DANNY', 'TYLER', 'DIANE', 'BETTY', 'JESSE', 'COHEN', 'LEONE', 'JENNY', 'EMACS', 'BURKE', 'MOSES', 'LOGAN', 'NIGER', 'BRENT', 'BUFFY', 'RILEY', 'HOMER', 'PEDRO', 'CHANG', 'FEDEX', 'LOHAN', 'DENIS', 'MIKES', 'KIRBY', 'ARIEL', 'MONTY', 'HOGAN', 'COREY', 'PRATT', 'ERICA', 'POLLY', 'ZAIRE', 'SAKAI', 'DORIS', 'TAMMY', 'ROWAN', 'YATES', 'RUBIN', 'BARRE', 'EMULE', 'BAYER', 'SANTO', 'WIGAN', 'NORMA', 'MONDO', 'WALLY', 'LIGNE', 'FRIST', 'SERGE', 'WALDO', 'MALIK', 'LOUIE', 'JUDAS', 'SCART', 'HANKS', 'BANDA', 'BANCO', 'BITTE', 'FLEUR', 'LEXIS', 'COLES', 'MERLE', 'FONDA', 'GINNY', 'ZORRO', 'CORSO', 'BRITT', 'PORTA', 'TELEX', 'TROIS', 'AMMAN', 'SWAMI', 'ENEWS', 'LAIRD', 'ENROL', 'MARGE', 'RIGGS', 'ALAND', 'GARDA', 'PAULS', 'SYKES', 'SLADE', 'DUMAS', 'PASEO', 'TABOR', 'DELFT', 'IDENT', 'LANAI', 'VERSO', 'BAMBI', 'BOWER', 'REPRO', 'SWAIN', 'WAITE', 'VARNA', 'CALIF', 'FLEXI', 'SERRA', 'MASSA', 'BRAVA', 'WAGGA', 'SURAT', 'HOYLE', 'LEVIS', 'DIDDY', 'PHISH', 'COVEY', 'DONNE', 'NANCE', 'MYLAR', 'MADRE', 'LINDY', 'ZLOTY', 'PYREX', 'WILCO', 'LIVRE', 'BARRA', 'BATIK', 'LISLE', 'CANTO', 'JOURS', 'JUNTA', 'DONNY', 'ERICK', 'CONTE', 'GEMMA', 'AYRES', 'COFFS', 'CANNA', 'FRITH', 'STEEN', 'AVION', 'COMER', 'TAPAS', 'CALLA', 'FESTA', 'SITKA', 'CODEN', 'NEATH', 'BAYES', 'SUCRE', 'ENDER', 'CONEY', 'DATOS', 'HOLLA', 'MISES', 'KARTS', 'HASTA', 'JEUNE', 'MOIRA', 'MANTA', 'COMPO', 'TARGA', 'SUMMA', 'FORME', 'SIDER', 'PROBS', 'AMITY', 'CASAS', 'LUPIN', 'EIDOS', 'HALLO', 'TOLAR', 'SOLON', 'SYSOP',  'RAINE', 'TANTO', 'PARTI', 'STYLI', 'MASSE', 'RASTA', 'LEGER', 'COTTA', 'CHOCK', 'THERM', 'HANTS', 'SITED', 'FLEER', 'KELTY', 'FILLY', 'LIBRI', 'AMICI', 'TELLY', 'ARLES', 'OZZIE', 'VROUW', 'MOLTO', 'GLENS', 'MEZZO', 'SYRAH', 'SENZA', 'CATES', 'TOILE', 'ANTES', 'BRANE', 'CHACO', 'LATED', 'MAVIS', 'LURED', 'GRAFF', 'HECHT', 'RAGGA', 'DIVAN', 'SNARK', 'PAPAS', 'THUMP', 'DECAF', 'MINAS', 'BRUIN', 'DIMER', 'DEWAR', 'CAPES', 'SALVO', 'NICOL', 'ODEON', 'ZACKS', 'FORZA', 'SCAND', 'SABHA', 'FLITE', 'MORRO', 'ZANTE', 'AKITA', 'BETTA', 'EMMET', 'LITAS', 'HAKIM', 'STOTT', 'BONNY', 'SWATH', 'ROUEN', 'LEGGE', 'YORKS', 'MESON', 'SENNA', 'LEBEN', 'ARTIC', 'KAROO', 'MIRZA', 'BEAUX', 'LITHO', 'THANE', 'SALVE', 'PROGS', 'BLUME', 'TABLA', 'TENGE', 'LENSE', 'CAMUS', 'PERES', 'COMTE', 'PASHA', 'PAISA', 'DURST', 'LICHT', 'CARLE', 'OBJET', 'RUMBA', 'LIBER', 'SODOM', 'CONUS', 'SPEER', 'PENNE', 'CORSE', 'RONDE', 'SILLS', 'NOYES', 'BURGH', 'DIKES', 'ALLOT', 'VESTA', 'JACKY', 'ARTIS', 'SELVA', 'APHIS', 'LOUGH', 'TRIOS', 'GIPSY', 'BASSO', 'SOREL', 'TONKA', 'LEMME', 'PLAGE', 'SERRE', 'KILEY', 'SPECT', 'HOWES', 'TAKIN', 'CAMAS', 'CHINE', 'HAMZA', 'NAPPA', 'SONNE', 'SHITE', 'CASCO', 'SABIN', 'GLEBE', 'MOTTE', 'HALES', 'SOYUZ', 'MANDI', 'BURSA', 'BAZAR', 'MAXIS', 'ILIAD', 'VERTU', 'DUBBO', 'SEDGE', 'FINCA', 'BEANO', 'MADGE', 'METIS', 'SCRAN', 'AVISO', 'PILAR', 'THORP', 'XENIA', 'DEBBY', 'PAOLI', 'APPRO', 'SAHIB', 'SENOR', 'FACIA', 'SPITZ', 'EMERG', 'GLACE', 'ADIOS', 'FATWA', 'STADE', 'POMBE', 'RABAT', 'CONTO', 'JAFFA', 'SYBIL', 'PEKIN', 'MENSA', 'TABER', 'HOYAS', 'NAIRA', 'BIJOU', 'BARCA', 'TACKS', 'LAKHS', 'FAERY', 'RIOJA', 'ETATS', 'TULLE', 'GABBY', 'MICKY', 'GOOEY', 'MANET', 'KONDO', 'DIDST', 'CAREX', 'MANOS', 'KENDO', 'GOLDS', 'MACHE', 'BRADS', 'GREBE', 'PAYED', 'PISTE', 'LINAC', 'CRUMP', 'CYCLO', 'FLUOR', 'REBBE', 'SURAH', 'DIXIT', 'PRISE', 'SIMBA', 'TERNS', 'HOSTA', 'LAZAR', 'PHARE', 'TATAR', 'ACKER', 'LYASE', 'BASSE', 'LLANO', 'SEDER', 'KYLIX', 'ZILLA', 'QUINT', 'KLANG', 'YUKOS', 'MIDGE', 'MELBA', 'MILOS', 'RIVAS', 'IMAGO', 'JAKES', 'BASTA', 'SELLE', 'PENNA', 'RICKS', 'HEALD', 'PERCE', 'SAREE', 'POLIS', 'FILLE', 'SAVIN', 'LORIS', 'KANDY', 'DOBRO', 'PLATS', 'DAMAN', 'MAMIE', 'LOMAS', 'GALLS', 'AMMON', 'AHOLD', 'DOBRA', 'SNOOK', 'MACHI', 'KARAS', 'CLARY', 'DUOMO', 'ORANG', 'BURKS', 'POOJA', 'SILEX', 'VIREO', 'GITES', 'AREAL', 'DOWNY','UTILE',  'HANKY', 'NICAD', 'VISTO', 'ROQUE', 'STURT', 'PARRA', 'VICHY', 'COMBE', 'APRES', 'TESTA', 'HIGHT', 'VARIA', 'TONEY', 'RAYNE', 'SISAL', 'MINOS', 'SENSI', 'CLAVE', 'HUNKY', 'ATRIA', 'CRESS', 'FICUS', 'CULPA', 'DERMA', 'BREVE', 'AXION', 'CLIFT', 'LOCUM', 'PAYOR', 'GRIFF', 'ESKER', 'SANGO', 'ALUMS', 'CARBO', 'ALIST', 'SARIN', 'INGLE', 'OCCAM', 'HYENA', 'DAFFY', 'DOOCE', 'KLICK', 'LARCH', 'SITUS', 'BOLES', 'ALINE', 'SWASH', 'TANGA', 'CLANK', 'MARTS', 'LOCOS', 'FLAVA', 'RUBLE', 'BRIER', 'COVES', 'DAMME', 'NODDY', 'NULLA', 'CLEVE', 'JAGER', 'SALIX', 'SISTA', 'CROCS', 'HOLME', 'ARCHI', 'BORGO', 'BILBO', 'HORAS', 'LOTTE', 'DUALS', 'RANDS', 'LANAS', 'KRAUT'}
 
 common_wordle_words_4k = [w for w in set(all_wordle_words[i][0] for i in range(4000)) if w not in not_these]
+
+# Frozen set views for fast membership tests. The lists above are kept for
+# ordered/weighted iteration; anything that only asks "is this a word?" should
+# use these instead of scanning a list.
+all_wordle_words_set = frozenset(w for w, _ in all_wordle_words)
+common_wordle_words_4k_set = frozenset(common_wordle_words_4k)
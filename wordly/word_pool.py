@@ -1,9 +1,12 @@
+import random
+
 from collections import Counter
 from math import log2
+from string import ascii_uppercase
 from typing import *
 
 from wordly.guess import Guess
-from wordly.word_list import all_wordle_words
+from wordly.word_list import all_wordle_words_set
 
 
 """
@@ -19,7 +22,7 @@ Used by the Solver to represent the set of possible solutions and the set of val
 class WordPool:
 
     def __init__(self):
-        self.pool = set(w[0] for w in all_wordle_words)  # all available words, initially the entire dictionary.
+        self.pool = set(all_wordle_words_set)  # all available words, initially the entire dictionary.
 
         # build lookup table of {character: word} to speed up queries
         self.lookup = {}
@@ -29,21 +32,84 @@ class WordPool:
                     self.lookup[c] = set()
                 self.lookup[c].add(w)
 
+        # build lookup table of {(character, position): words}, so exact-position
+        # constraints can be applied by set operations instead of scanning words
+        self.pos_lookup = {(c, i): set() for c in ascii_uppercase for i in range(5)}
+        for w in self.pool:
+            for i, c in enumerate(w):
+                self.pos_lookup[(c, i)].add(w)
+
         # build position counts table, for entropy calcs
         self.pos_counts = []
         for i in range(5):
             self.pos_counts.append(Counter([w[i] for w in self.pool]))
 
+        # cached tuple view of the pool, rebuilt lazily after mutations
+        self._pool_tuple = None
+
+    def as_tuple(self) -> tuple:
+        """Return the pool as a tuple, cached until the pool next changes."""
+        if self._pool_tuple is None:
+            self._pool_tuple = tuple(self.pool)
+        return self._pool_tuple
+
+    def sample(self, k: int) -> list:
+        """Return k words sampled from the pool without replacement."""
+        return random.sample(self.as_tuple(), k)
+
+    def __deepcopy__(self, memo):
+        """
+        Specialized deepcopy that skips the generic object-graph walk.
+
+        A WordPool only holds containers of immutable strings, so shallow
+        copies of each container are a full deep copy. The solver copies
+        pools constantly while searching, so this is worth special-casing.
+        """
+        new = WordPool.__new__(WordPool)
+        new.pool = self.pool.copy()
+        new.lookup = {c: words.copy() for c, words in self.lookup.items()}
+        new.pos_lookup = {k: words.copy() for k, words in self.pos_lookup.items()}
+        new.pos_counts = [counts.copy() for counts in self.pos_counts]
+        new._pool_tuple = self._pool_tuple  # immutable, safe to share
+        return new
+
     def remove(self, w: str):
         """Remove a single word from the pool, and update associated data structures."""
         if w not in self.pool:
             return
         self.pool.remove(w)
+        self._pool_tuple = None
         for i, c in enumerate(w):
             if w in self.lookup[c]:
                 self.lookup[c].remove(w)
+            self.pos_lookup[(c, i)].discard(w)
             self.pos_counts[i][c] -= 1
 
+    def _add(self, w: str):
+        """Add a word back to the pool, and update associated data structures."""
+        if w in self.pool:
+            return
+        self.pool.add(w)
+        self._pool_tuple = None
+        for i, c in enumerate(w):
+            self.lookup[c].add(w)
+            self.pos_lookup[(c, i)].add(w)
+            self.pos_counts[i][c] += 1
+
+    def snapshot(self) -> set:
+        """
+        Capture the current pool contents, for use with restore().
+
+        Much cheaper than deepcopying the whole pool as an undo buffer: only
+        the word set is copied, and restore() pays per word actually removed.
+        """
+        return self.pool.copy()
+
+    def restore(self, snap: set):
+        """Undo any removals made since snapshot() by re-adding the missing words."""
+        for w in snap - self.pool:
+            self._add(w)
+
     def remove_all_except(self, these: set):
         """Remove all words except for these from the pool."""
         for w in self.pool.difference(these):
@@ -51,11 +117,8 @@ class WordPool:
 
     def match_char_pos(self, char: str, pos: int) -> set:
         """Get all words matching a char in a specific position."""
-        matches = set()
-        for w in self.lookup[char]:
-            if w[pos] == char:
-                matches.add(w)
-        return matches
+        # copy, so callers can remove words while iterating the result
+        return set(self.pos_lookup[(char, pos)])
     
     def __str__(self):
         if len(self.pool) <= 10:
@@ -152,11 +215,7 @@ class WordPool:
         # We only need 'result' here because 'result' contains all exact matches.
         for i, c in enumerate(result):
             if c not in ['.', '?']:
-                viable = set()
-                for w in self.lookup[c]:
-                    if w[i] == c:
-                        viable.add(w)
-                self.remove_all_except(viable)
+                self.remove_all_except(self.pos_lookup[(c, i)])
 
     def _apply_inexact_matches(self, guess: str, result: str):
         # Yellow gives us two pieces. It's in the word... but it's not in this position.
@@ -166,14 +225,11 @@ class WordPool:
         q_counts = {}
         for i, c in enumerate(guess):
             if result[i] == '?':
-                viable = set()
                 if c not in q_counts:
                     q_counts[c] = 1
                 else:
                     q_counts[c] += 1
-                for w in self.lookup[c]:
-                    if w[i] != c:
-                        viable.add(w)
+                viable = self.lookup[c] - self.pos_lookup[(c, i)]
                 self.remove_all_except(viable)
         # Two or more yellows of the same letter can narrow results further.
         # Handle two yellows of the same character, e.g. guess = 'chess' and target = 'assay'